@@ -1,6 +1,11 @@
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
+# Shared session so repeated calls reuse pooled keep-alive connections
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3))
+
 # Test the POST /users/ endpoint
 url = "http://localhost:8000/users/"
 data = {
@@ -16,7 +21,7 @@ print(f"Data: {json.dumps(data, indent=2)}")
 print()
 
 try:
-    response = requests.post(url, json=data)
+    response = _session.post(url, json=data)
     print(f"Status Code: {response.status_code}")
     print(f"Response: {response.text}")
 except Exception as e:
@@ -13,7 +13,8 @@ For headless mode:
     locust -f locustfile.py --host=http://localhost:8000 --users 100 --spawn-rate 10 --run-time 1m --headless
 """
 
-from locust import HttpUser, task, between, SequentialTaskSet
+from locust import task, between, SequentialTaskSet
+from locust.contrib.fasthttp import FastHttpUser
 from uuid import uuid4
 import random
 
@@ -30,11 +31,11 @@ class UserBehavior(SequentialTaskSet):
     5. Delete resources
     """
     
-    created_user_ids = []
-    created_post_ids = []
-    
     def on_start(self):
         """Initialize test data when user starts."""
+        # Per-user state: each simulated user tracks only what it created
+        self.created_user_ids = []
+        self.created_post_ids = []
         self.user_email = f"loadtest-{uuid4()}@example.com"
         self.post_slug = f"loadtest-{uuid4().hex[:8]}"
     
@@ -236,7 +237,7 @@ class UserBehavior(SequentialTaskSet):
                     response.failure(f"Got status code {response.status_code}")
 
 
-class APIUser(HttpUser):
+class APIUser(FastHttpUser):
     """
     Simulated user for load testing.
     
@@ -247,16 +248,14 @@ class APIUser(HttpUser):
     tasks = [UserBehavior]
     wait_time = between(1, 5)  # Wait 1-5 seconds between tasks
     
-    # Add custom headers if needed
-    def on_start(self):
-        """Called when a simulated user starts."""
-        self.client.headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Locust Load Test"
-        }
+    # Custom headers sent with every request (FastHttpUser applies these per session)
+    default_headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Locust Load Test"
+    }
 
 
-class QuickTest(HttpUser):
+class QuickTest(FastHttpUser):
     """
     Quick smoke test user - hits endpoints rapidly without waiting.
     Use this to quickly verify API can handle high request rates.
@@ -1,16 +1,311 @@
-from typing import Annotated, List, Dict, Any
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import Annotated, List, Dict, Any, Optional
 from uuid import UUID
-from datetime import datetime, timezone
-from fastapi import FastAPI, HTTPException, Depends, status, Query, Request
-from pydantic import BaseModel, Field
-from models.user import UserBase, UserRole, UserRead, UserCreate, UserUpdate
-from models.blog_post import BlogPostBase, BlogPostRead, BlogPostCreate, BlogPostUpdate
+from fastapi import FastAPI, HTTPException, Depends, Path, status, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter
+from models.user import UserBase, UserRead, UserCreate, UserUpdate
+from models.blog_post import BlogPostBase, BlogPostRead, BlogPostCreate, BlogPostUpdate, utc_now
+
+# Storage backend: in-memory dicts by default. Set REDIS_URL to keep users and
+# posts in Redis instead, so several uvicorn workers share one data set.
+REDIS_URL = os.getenv("REDIS_URL")
+redis_client = None  # redis.asyncio.Redis, created at startup when REDIS_URL is set
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global redis_client
+    if REDIS_URL:
+        # Optional dependency - only needed for the shared-store mode
+        import redis.asyncio as redis
+
+        pool = redis.ConnectionPool.from_url(REDIS_URL, max_connections=50, decode_responses=True)
+        redis_client = redis.Redis(connection_pool=pool)
+        yield
+        await redis_client.aclose()
+        await pool.disconnect()
+        redis_client = None
+    else:
+        yield
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# Uvicorn's per-request access log is a measurable cost under load tests;
+# set DISABLE_ACCESS_LOG=1 when the server is started by `fastapi run/dev`
+if os.getenv("DISABLE_ACCESS_LOG") == "1":
+    logging.getLogger("uvicorn.access").disabled = True
+
+# Path ids stay plain strings: the UUID pattern is checked by pydantic-core
+# and the handlers never build a UUID object just to look it up. Like a UUID
+# parameter, it accepts any hex case and omitted hyphens.
+UUID_PATTERN = (
+    r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$"
+)
+
+
+def _store_key(value: str) -> str:
+    """Canonical lowercase, hyphenated form - the key records are stored under."""
+    # Only the rare hyphenless spelling pays for a UUID round trip
+    return value.lower() if len(value) == 36 else str(UUID(value))
+
+
+UUIDPath = Annotated[
+    str,
+    Path(pattern=UUID_PATTERN, json_schema_extra={"format": "uuid"}),
+    AfterValidator(_store_key),
+]
+
+# In-memory fake DB, keyed by the UUID's string form (stringified once on
+# insert) so lookups hash a short str instead of going through UUID.__hash__
+fake_db: Dict[str, UserBase] = {}
+fake_blog_db: Dict[str, BlogPostBase] = {}
+
+# Secondary indexes for O(1) idempotency lookups
+email_index: Dict[str, str] = {}
+slug_index: Dict[str, str] = {}
+
+# Read models, refreshed on every mutation so list endpoints don't
+# re-validate each record through UserRead/BlogPostRead per request
+user_read_cache: Dict[str, UserRead] = {}
+post_read_cache: Dict[str, BlogPostRead] = {}
+
+# Built once; list endpoints serialize straight to JSON bytes with these
+_USERS_LIST_ADAPTER = TypeAdapter(List[UserRead])
+_POSTS_LIST_ADAPTER = TypeAdapter(List[BlogPostRead])
+
+
+def cache_user_read(key: str, user: UserBase) -> None:
+    # Stored users are already validated, so skip UserRead validation
+    user_read_cache[key] = UserRead.from_orm_fast(user)
+
+
+def cache_post_read(key: str, post: BlogPostBase) -> None:
+    post_read_cache[key] = BlogPostRead.model_validate(post.__dict__)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Storage - every read/write goes through these so endpoints don't care
+# whether data lives in this process or in Redis.
+#
+# Redis layout: "user:{id}" / "post:{id}" hold the record as JSON,
+# "users:email" / "posts:slug" hashes are the idempotency indexes, and
+# "users:ids" / "posts:ids" sorted sets (scored by an INCR counter) keep
+# insertion order for pagination. Every write that touches an index runs as
+# one Lua script, so other workers never see an index entry without its
+# record or lose an entry to a stale compare-and-delete.
+# ─────────────────────────────────────────────────────────────────────────────
+
+# KEYS: index, record, ids, seq   ARGV: index field, id, json, record key prefix
+# Returns the existing record's JSON if the field is already taken, else nil.
+# Index entries are only ever written together with their record, so one
+# pointing at a missing record is stale and is safe to take over.
+_INSERT_SCRIPT = """
+local existing = redis.call('HGET', KEYS[1], ARGV[1])
+if existing then
+    local raw = redis.call('GET', ARGV[4] .. existing)
+    if raw then return raw end
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+redis.call('SET', KEYS[2], ARGV[3])
+redis.call('ZADD', KEYS[3], redis.call('INCR', KEYS[4]), ARGV[2])
+return false
+"""
+
+# KEYS: index, record   ARGV: previous field, new field, id, json
+# Returns 0 without writing if the record was deleted since it was loaded,
+# so a late PATCH can't bring it back outside the ids sorted set.
+_REPLACE_SCRIPT = """
+if redis.call('EXISTS', KEYS[2]) == 0 then return 0 end
+if ARGV[1] ~= ARGV[2] then
+    if redis.call('HGET', KEYS[1], ARGV[1]) == ARGV[3] then
+        redis.call('HDEL', KEYS[1], ARGV[1])
+    end
+    redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+end
+redis.call('SET', KEYS[2], ARGV[4])
+return 1
+"""
+
+# KEYS: index, record, ids   ARGV: index field, id
+_REMOVE_SCRIPT = """
+if redis.call('HGET', KEYS[1], ARGV[1]) == ARGV[2] then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+end
+redis.call('DEL', KEYS[2])
+redis.call('ZREM', KEYS[3], ARGV[2])
+"""
+
+# Registered once per script; EVALSHA then runs against the current client
+_scripts: Dict[str, Any] = {}
+
+
+async def _run_script(source: str, keys: List[str], args: List[str]) -> Any:
+    script = _scripts.get(source)
+    if script is None:
+        script = _scripts[source] = redis_client.register_script(source)
+    return await script(keys=keys, args=args, client=redis_client)
+
+
+def _page_bounds(skip: int, limit: int) -> tuple[int, int]:
+    """Half-open [start, stop) for a page, clamped to what islice/ZRANGE accept."""
+    return min(skip, sys.maxsize), min(skip + limit, sys.maxsize)
+
+
+async def load_user(key: str) -> Optional[UserBase]:
+    if redis_client is None:
+        return fake_db.get(key)
+    raw = await redis_client.get(f"user:{key}")
+    return UserBase.model_validate_json(raw) if raw else None
+
+
+async def find_user_by_email(email: str) -> Optional[UserBase]:
+    if redis_client is None:
+        existing_id = email_index.get(email)
+        return fake_db[existing_id] if existing_id is not None else None
+    existing_id = await redis_client.hget("users:email", email)
+    return await load_user(existing_id) if existing_id else None
+
+
+async def insert_user(user: UserBase) -> UserBase:
+    """Store a new user; returns the existing one if its email was taken meanwhile."""
+    key = str(user.id)
+    if redis_client is None:
+        fake_db[key] = user
+        email_index[user.email] = key
+        cache_user_read(key, user)
+        return user
+    existing = await _run_script(
+        _INSERT_SCRIPT,
+        ["users:email", f"user:{key}", "users:ids", "users:seq"],
+        [user.email, key, user.model_dump_json(), "user:"],
+    )
+    # Another worker created this email between our lookup and insert
+    return UserBase.model_validate_json(existing) if existing else user
+
+
+async def replace_user(key: str, user: UserBase, previous_email: str) -> None:
+    """Store an updated user; raises 404 if it was deleted since it was loaded."""
+    email_changed = user.email != previous_email
+    if redis_client is None:
+        if key not in fake_db:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        # Keep the email index in sync when the email changes
+        if email_changed:
+            if email_index.get(previous_email) == key:
+                del email_index[previous_email]
+            email_index[user.email] = key
+        fake_db[key] = user
+        cache_user_read(key, user)
+        return
+    if not await _run_script(
+        _REPLACE_SCRIPT,
+        ["users:email", f"user:{key}"],
+        [previous_email, user.email, key, user.model_dump_json()],
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+
+
+async def remove_user(key: str, user: UserBase) -> None:
+    if redis_client is None:
+        if email_index.get(user.email) == key:
+            del email_index[user.email]
+        del fake_db[key]
+        del user_read_cache[key]
+        return
+    await _run_script(_REMOVE_SCRIPT, ["users:email", f"user:{key}", "users:ids"], [user.email, key])
+
+
+async def list_users(skip: int, limit: int) -> List[UserRead]:
+    start, stop = _page_bounds(skip, limit)
+    if redis_client is None:
+        return list(islice(user_read_cache.values(), start, stop))
+    ids = await redis_client.zrange("users:ids", start, stop - 1)
+    if not ids:
+        return []
+    # UserRead ignores the extra stored fields (password), one MGET round trip
+    raws = await redis_client.mget([f"user:{i}" for i in ids])
+    return [UserRead.model_validate_json(raw) for raw in raws if raw]
+
+
+async def load_post(key: str) -> Optional[BlogPostBase]:
+    if redis_client is None:
+        return fake_blog_db.get(key)
+    raw = await redis_client.get(f"post:{key}")
+    return BlogPostBase.model_validate_json(raw) if raw else None
+
+
+async def find_post_by_slug(slug: str) -> Optional[BlogPostBase]:
+    if redis_client is None:
+        existing_id = slug_index.get(slug)
+        return fake_blog_db[existing_id] if existing_id is not None else None
+    existing_id = await redis_client.hget("posts:slug", slug)
+    return await load_post(existing_id) if existing_id else None
+
+
+async def insert_post(post: BlogPostBase) -> BlogPostBase:
+    """Store a new post; returns the existing one if its slug was taken meanwhile."""
+    key = str(post.id)
+    if redis_client is None:
+        fake_blog_db[key] = post
+        slug_index[post.slug] = key
+        cache_post_read(key, post)
+        return post
+    existing = await _run_script(
+        _INSERT_SCRIPT,
+        ["posts:slug", f"post:{key}", "posts:ids", "posts:seq"],
+        [post.slug, key, post.model_dump_json(), "post:"],
+    )
+    # Another worker created this slug between our lookup and insert
+    return BlogPostBase.model_validate_json(existing) if existing else post
+
+
+async def replace_post(key: str, post: BlogPostBase, previous_slug: str) -> None:
+    """Store an updated post; raises 404 if it was deleted since it was loaded."""
+    slug_changed = post.slug != previous_slug
+    if redis_client is None:
+        if key not in fake_blog_db:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found")
+        # Keep the slug index in sync when the slug changes
+        if slug_changed:
+            if slug_index.get(previous_slug) == key:
+                del slug_index[previous_slug]
+            slug_index[post.slug] = key
+        fake_blog_db[key] = post
+        cache_post_read(key, post)
+        return
+    if not await _run_script(
+        _REPLACE_SCRIPT,
+        ["posts:slug", f"post:{key}"],
+        [previous_slug, post.slug, key, post.model_dump_json()],
+    ):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found")
 
-app = FastAPI()
 
-# In-memory fake DB
-fake_db: Dict[UUID, UserBase] = {}
-fake_blog_db: Dict[UUID, BlogPostBase] = {}
+async def remove_post(key: str, post: BlogPostBase) -> None:
+    if redis_client is None:
+        if slug_index.get(post.slug) == key:
+            del slug_index[post.slug]
+        del fake_blog_db[key]
+        del post_read_cache[key]
+        return
+    await _run_script(_REMOVE_SCRIPT, ["posts:slug", f"post:{key}", "posts:ids"], [post.slug, key])
+
+
+async def list_posts(skip: int, limit: int) -> List[BlogPostRead]:
+    start, stop = _page_bounds(skip, limit)
+    if redis_client is None:
+        return list(islice(post_read_cache.values(), start, stop))
+    ids = await redis_client.zrange("posts:ids", start, stop - 1)
+    if not ids:
+        return []
+    raws = await redis_client.mget([f"post:{i}" for i in ids])
+    return [BlogPostRead.model_validate_json(raw) for raw in raws if raw]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -33,35 +328,35 @@ class MixedErrorResponse(BaseModel):
 # ─────────────────────────────────────────────────────────────────────────────
 # Dependencies
 # ─────────────────────────────────────────────────────────────────────────────
-def get_user_from_db(user_id: UUID) -> UserBase:
-    user = fake_db.get(user_id)
+async def get_user_from_db(user_id: UUIDPath) -> UserBase:
+    user = await load_user(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
     return user
 
 
-def get_all_users_from_db() -> List[UserBase]:
-    return list(fake_db.values())
-
-
 # Custom strict query param validation – now returns proper validation errors
 def strict_query_params(allowed: set[str]):
+    allowed = frozenset(allowed)
+
     def dependency(request: Request):
-        unknown = [k for k in request.query_params.keys() if k not in allowed]
-        if unknown:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=[
-                    {
-                        "type": "value_error",
-                        "loc": ["query", param],
-                        "msg": "Unknown query parameter",
-                        "input": request.query_params[param],
-                    }
-                    for param in unknown
-                ],
-            )
-        return True
+        keys = request.query_params.keys()
+        if not keys - allowed:
+            return True
+        # Slow path only: keep the client's parameter order in the error detail
+        unknown = [k for k in keys if k not in allowed]
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[
+                {
+                    "type": "value_error",
+                    "loc": ["query", param],
+                    "msg": "Unknown query parameter",
+                    "input": request.query_params[param],
+                }
+                for param in unknown
+            ],
+        )
     return dependency
 
 
@@ -94,37 +389,35 @@ def strict_query_params(allowed: set[str]):
 )
 async def create_user(user: UserCreate):
     # Check if user with this email already exists
-    existing_user = next((u for u in fake_db.values() if u.email == user.email), None)
-    if existing_user:
+    existing_user = await find_user_by_email(user.email)
+    if existing_user is not None:
         # Idempotent POST - return existing user instead of 409 Conflict
         return existing_user
     
-    # Extract the secret value from SecretStr before passing to UserBase
-    # This prevents Pydantic from trying to double-wrap the SecretStr
     new_user = UserBase(
         email=user.email,
-        password=user.password.get_secret_value(),
+        password=user.password,
         first_name=user.first_name,
         last_name=user.last_name,
     )
-    fake_db[new_user.id] = new_user
-    return new_user
+    return await insert_user(new_user)
 
 
 @app.get(
     "/users/",
-    response_model=List[UserRead],
+    response_model=None,
     dependencies=[Depends(strict_query_params({"skip", "limit"}))],
     responses={
+        200: {"model": List[UserRead], "description": "Successful Response"},
         422: {"model": HTTPValidationError, "description": "Validation error"},
     },
 )
 async def read_users(
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
-    users_data: List[UserBase] = Depends(get_all_users_from_db),
 ):
-    return users_data[skip : skip + limit]
+    users = await list_users(skip, limit)
+    return Response(_USERS_LIST_ADAPTER.dump_json(users), media_type="application/json")
 
 
 @app.get(
@@ -135,7 +428,7 @@ async def read_users(
         422: {"model": HTTPValidationError},
     },
 )
-async def read_user(user_id: UUID, user: UserBase = Depends(get_user_from_db)):
+async def read_user(user_id: UUIDPath, user: UserBase = Depends(get_user_from_db)):
     return user
 
 
@@ -148,28 +441,26 @@ async def read_user(user_id: UUID, user: UserBase = Depends(get_user_from_db)):
     },
 )
 async def update_user(
-    user_id: UUID,
+    user_id: UUIDPath,
     user_update: UserUpdate,
     user_in_db: UserBase = Depends(get_user_from_db),
 ):
-    # Get update data, excluding unset fields
-    update_data = user_update.model_dump(exclude_unset=True)
-    
-    # Skip None values from update (don't update fields to None unless they're Optional)
+    # Get update data in one pass: only fields the client set, skipping None values
+    # (don't update fields to None unless they're Optional).
     # This prevents setting required fields like 'role' to None
-    update_data = {k: v for k, v in update_data.items() if v is not None}
-
-    # Update fields
-    for field, value in update_data.items():
-        if hasattr(user_in_db, field):
-            # Handle password SecretStr properly
-            if field == "password":
-                # Extract secret value if it's a SecretStr
-                if hasattr(value, 'get_secret_value'):
-                    value = value.get_secret_value()
-            setattr(user_in_db, field, value)
-
-    fake_db[user_id] = user_in_db
+    update_data = {
+        field: value
+        for field in user_update.model_fields_set
+        if (value := getattr(user_update, field)) is not None
+    }
+
+    previous_email = user_in_db.email
+
+    # Update fields in one go - values were already validated by UserUpdate,
+    # and every UserUpdate field exists on UserBase (password stays a MaskedStr)
+    user_in_db.__dict__.update(update_data)
+
+    await replace_user(user_id, user_in_db, previous_email)
     return user_in_db
 
 
@@ -181,25 +472,21 @@ async def update_user(
         422: {"model": HTTPValidationError},
     },
 )
-async def delete_user(user_id: UUID, user: UserBase = Depends(get_user_from_db)):
-    del fake_db[user_id]
+async def delete_user(user_id: UUIDPath, user: UserBase = Depends(get_user_from_db)):
+    await remove_user(user_id, user)
     return None  # 204 No Content
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Blog Post Dependencies
 # ─────────────────────────────────────────────────────────────────────────────
-def get_blog_post_from_db(post_id: UUID) -> BlogPostBase:
-    post = fake_blog_db.get(post_id)
+async def get_blog_post_from_db(post_id: UUIDPath) -> BlogPostBase:
+    post = await load_post(post_id)
     if not post:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog post not found")
     return post
 
 
-def get_all_blog_posts_from_db() -> List[BlogPostBase]:
-    return list(fake_blog_db.values())
-
-
 # ─────────────────────────────────────────────────────────────────────────────
 # Blog Post Endpoints
 # ─────────────────────────────────────────────────────────────────────────────
@@ -229,8 +516,8 @@ async def create_blog_post(post: BlogPostCreate):
     """Create blog post - IDEMPOTENT to avoid 409."""
     
     # Check if post with same slug exists (idempotent POST)
-    existing = next((p for p in fake_blog_db.values() if p.slug == post.slug), None)
-    if existing:
+    existing = await find_post_by_slug(post.slug)
+    if existing is not None:
         return existing  # 200 OK, NOT 409!
     
     # Create new post
@@ -242,24 +529,24 @@ async def create_blog_post(post: BlogPostCreate):
         is_published=post.is_published,
         author_id=post.author_id,
     )
-    fake_blog_db[new_post.id] = new_post
-    return new_post
+    return await insert_post(new_post)
 
 
 @app.get(
     "/posts/",
-    response_model=List[BlogPostRead],
+    response_model=None,
     dependencies=[Depends(strict_query_params({"skip", "limit"}))],
     responses={
+        200: {"model": List[BlogPostRead], "description": "Successful Response"},
         422: {"model": HTTPValidationError, "description": "Validation error"},
     },
 )
 async def read_blog_posts(
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 100,
-    posts_data: List[BlogPostBase] = Depends(get_all_blog_posts_from_db),
 ):
-    return posts_data[skip : skip + limit]
+    posts = await list_posts(skip, limit)
+    return Response(_POSTS_LIST_ADAPTER.dump_json(posts), media_type="application/json")
 
 
 @app.get(
@@ -270,7 +557,7 @@ async def read_blog_posts(
         422: {"model": HTTPValidationError},
     },
 )
-async def read_blog_post(post_id: UUID, post: BlogPostBase = Depends(get_blog_post_from_db)):
+async def read_blog_post(post_id: UUIDPath, post: BlogPostBase = Depends(get_blog_post_from_db)):
     return post
 
 
@@ -283,26 +570,29 @@ async def read_blog_post(post_id: UUID, post: BlogPostBase = Depends(get_blog_po
     },
 )
 async def update_blog_post(
-    post_id: UUID,
+    post_id: UUIDPath,
     post_update: BlogPostUpdate,
     post_in_db: BlogPostBase = Depends(get_blog_post_from_db),
 ):
     """Update blog post - NO slug uniqueness check to avoid 409."""
     
-    # Get update data (exclude unset fields)
-    update_data = post_update.model_dump(exclude_unset=True)
-    update_data = {k: v for k, v in update_data.items() if v is not None}
+    # Get update data in one pass (only set fields, skipping None values)
+    update_data = {
+        field: value
+        for field in post_update.model_fields_set
+        if (value := getattr(post_update, field)) is not None
+    }
     
     # Update timestamp
     if update_data:
-        update_data['updated_at'] = datetime.now(timezone.utc)
+        update_data['updated_at'] = utc_now()
     
-    # NO slug uniqueness check - just update
-    for field, value in update_data.items():
-        if hasattr(post_in_db, field):
-            setattr(post_in_db, field, value)
+    previous_slug = post_in_db.slug
+
+    # NO slug uniqueness check - just update (values already validated by BlogPostUpdate)
+    post_in_db.__dict__.update(update_data)
     
-    fake_blog_db[post_id] = post_in_db
+    await replace_post(post_id, post_in_db, previous_slug)
     return post_in_db
 
 
@@ -314,6 +604,6 @@ async def update_blog_post(
         422: {"model": HTTPValidationError},
     },
 )
-async def delete_blog_post(post_id: UUID, post: BlogPostBase = Depends(get_blog_post_from_db)):
-    del fake_blog_db[post_id]
+async def delete_blog_post(post_id: UUIDPath, post: BlogPostBase = Depends(get_blog_post_from_db)):
+    await remove_post(post_id, post)
     return None  # 204 No Content
\ No newline at end of file
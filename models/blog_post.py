@@ -1,20 +1,30 @@
-import re
 from datetime import datetime, timezone
+from time import monotonic
 from typing import Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 
 # ASCII-only patterns (following FASTAPI_ASSISTANT_PROMPT.md rules)
+# Enforced solely via Field(pattern=...), which pydantic-core validates natively
 TITLE_PATTERN = r'^[A-Za-z0-9 \'\"\-\!\?\.\,\:\;]+$'  # Explicit ASCII chars
 SLUG_PATTERN = r'^[a-z0-9]+(?:-[a-z0-9]+)*$'  # kebab-case, ASCII only
 EXCERPT_PATTERN = r'^[A-Za-z0-9 \'\"\-\!\?\.\,\:\;\n]+$'  # Text with newlines
-CONTENT_PATTERN = r'^[\w\W]+$'  # Any content (we'll rely on length validation)
+
+
+# Last timestamp handed out by utc_now(), reused for up to 1 ms
+_last_now_ts: float = float("-inf")
+_last_now_dt: datetime = datetime.min.replace(tzinfo=timezone.utc)
 
 
 def utc_now() -> datetime:
-    """Get current UTC time with timezone info."""
-    return datetime.now(timezone.utc)
+    """Get current UTC time with timezone info (cached at millisecond granularity)."""
+    global _last_now_ts, _last_now_dt
+    ts = monotonic()
+    if ts - _last_now_ts >= 0.001:
+        _last_now_dt = datetime.now(timezone.utc)
+        _last_now_ts = ts
+    return _last_now_dt
 
 
 class BlogPostBase(BaseModel):
@@ -86,30 +96,21 @@ class BlogPostCreate(BaseModel):
     is_published: bool = Field(False, description="Publish immediately?", strict=True)
     author_id: UUID = Field(..., description="Author UUID")
 
-    # Validators MUST match schema exactly (not stricter!)
-    @field_validator("slug")
-    @classmethod
-    def validate_slug(cls, v: str) -> str:
-        if not re.match(SLUG_PATTERN, v):
-            raise ValueError("Slug must be kebab-case with ASCII letters, numbers, and hyphens only")
-        return v
-
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        if not re.match(TITLE_PATTERN, v):
-            raise ValueError("Title contains forbidden characters")
-        return v
-
-    @field_validator("excerpt")
-    @classmethod
-    def validate_excerpt(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not re.match(EXCERPT_PATTERN, v):
-            raise ValueError("Excerpt contains forbidden characters")
-        return v
-
     # Forbid unknown fields (Schemathesis will send random extras!)
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(
+        extra="forbid",
+        # Known-valid payload for Schemathesis' explicit examples phase
+        json_schema_extra={
+            "examples": [{
+                "title": "Hello World",
+                "slug": "hello-world",
+                "excerpt": "A short teaser.",
+                "content": "The full content of the first post.",
+                "is_published": False,
+                "author_id": "a1b2c3d4-e5f6-7890-1234-567890abcdef",
+            }]
+        },
+    )
 
 
 class BlogPostUpdate(BaseModel):
@@ -140,28 +141,6 @@ class BlogPostUpdate(BaseModel):
     is_published: Optional[bool] = Field(None, strict=True)
     author_id: Optional[UUID] = None
 
-    # Same validators as create (only run when value is provided)
-    @field_validator("slug")
-    @classmethod
-    def validate_slug(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not re.match(SLUG_PATTERN, v):
-            raise ValueError("Slug must be kebab-case with ASCII letters, numbers, and hyphens only")
-        return v
-
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not re.match(TITLE_PATTERN, v):
-            raise ValueError("Title contains forbidden characters")
-        return v
-
-    @field_validator("excerpt")
-    @classmethod
-    def validate_excerpt(cls, v: Optional[str]) -> Optional[str]:
-        if v is not None and not re.match(EXCERPT_PATTERN, v):
-            raise ValueError("Excerpt contains forbidden characters")
-        return v
-
     model_config = ConfigDict(extra="forbid")
 
 
@@ -176,5 +155,3 @@ class BlogPostRead(BaseModel):
     author_id: UUID
     created_at: datetime
     updated_at: datetime
-
-    model_config = ConfigDict(from_attributes=True)
@@ -1,44 +1,113 @@
-import re
-from datetime import UTC, datetime
-from typing import Optional, List
+from typing import Annotated, Any, Literal, Optional, List
 from uuid import UUID, uuid4
-from enum import Enum
+from functools import lru_cache
 
 from pydantic import (
+    AfterValidator,
     BaseModel,
     ConfigDict,
-    EmailStr,
     Field,
-    SecretStr,
-    field_validator,
+    GetCoreSchemaHandler,
+    GetJsonSchemaHandler,
+    WithJsonSchema,
 )
+from pydantic_core import core_schema
+from pydantic.networks import validate_email
 
-class UserRole(str, Enum):
-    USER = "USER"
-    ADMIN = "ADMIN"
+# Field annotation for roles: a Literal validates as a single membership check
+# in pydantic-core, without Enum construction
+UserRole = Literal["USER", "ADMIN"]
 
 # Password pattern - matches EXACTLY what we validate
 # Uses ASCII-only character classes to avoid Unicode digit issues
 PASSWORD_PATTERN = r'^[A-Za-z0-9@$!%*?&]{8,128}$'
+NAME_PATTERN = r'^[A-Za-z \'\-]+$'
 
-def validate_password_complexity(v: Optional[SecretStr]) -> Optional[SecretStr]:
+# Allowed password bytes - same set as PASSWORD_PATTERN. bytes.translate()
+# deletes them in C, so anything left over is a forbidden character.
+_PASSWORD_ALLOWED_BYTES = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789@$!%*?&"
+)
+
+class MaskedStr(str):
+    """A str whose repr is masked, so passwords stay out of logs and tracebacks.
+
+    Unlike SecretStr the value is the string itself, so validators read it
+    directly instead of going through get_secret_value().
+    """
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "'**********'"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_after_validator_function(cls, core_schema.str_schema())
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict:
+        json_schema = handler(schema)
+        json_schema.update(format="password", writeOnly=True)
+        return json_schema
+
+def validate_password_complexity(v: MaskedStr) -> MaskedStr:
     """Shared password validation logic - matches schema exactly."""
-    if v is None:
-        return v
-    
-    value = v.get_secret_value()
-    
-    # Check length
-    if len(value) < 8 or len(value) > 128:
-        raise ValueError('Password must be between 8 and 128 characters')
-    
-    # Check allowed characters - ASCII only, no Unicode digits
+    # Check length (8-128) and allowed characters - ASCII only, no Unicode digits
     # This MUST match the JSON Schema pattern exactly
-    if not re.match(r'^[A-Za-z0-9@$!%*?&]+$', value):
-        raise ValueError('Password contains invalid characters. Only A-Z, a-z, 0-9, @$!%*?& are allowed')
+    if (
+        not v.isascii()
+        or not 8 <= len(v) <= 128
+        or v.encode("ascii").translate(None, _PASSWORD_ALLOWED_BYTES)
+    ):
+        raise ValueError(
+            'Password must be 8-128 characters long and contain only A-Z, a-z, 0-9, @$!%*?&'
+        )
     
     return v
 
+# Include pattern in schema to guide test data generation
+# Note: StringConstraints doesn't work well with custom str types in Pydantic v2,
+# so the constraints are added to each model's JSON schema instead - once per
+# model via model_config, not as per-field extras copied into the core schema
+_PASSWORD_SCHEMA = {
+    "minLength": 8,
+    "maxLength": 128,
+    "pattern": PASSWORD_PATTERN,
+}
+
+
+def _password_schema_extra(examples: Optional[List[dict]] = None):
+    """Build a model-level json_schema_extra that documents the password field."""
+    def extra(schema: dict, model: type) -> None:
+        password = schema["properties"]["password"]
+        password.update(_PASSWORD_SCHEMA)
+        password.pop("format", None)  # Remove format:password to match our actual validation
+        if examples is not None:
+            schema["examples"] = examples
+    return extra
+
+
+# One password type shared by every model. The validator sits inside Optional
+# so pydantic-core short-circuits None (and unset fields are never validated)
+PasswordField = Annotated[MaskedStr, AfterValidator(validate_password_complexity)]
+OptionalPasswordField = Optional[PasswordField]
+
+@lru_cache(maxsize=4096)
+def _validate_email_cached(value: str) -> str:
+    """EmailStr's validation, memoized for addresses seen repeatedly (e.g. fuzzing)."""
+    return validate_email(value)[1]
+
+# Shared email type: same validation and schema as EmailStr, one definition
+EmailField = Annotated[
+    str,
+    AfterValidator(_validate_email_cached),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
 class UserQueryParams(BaseModel):
     skip: int = Field(default=0, ge=0, description="Number of records to skip")
     limit: int = Field(default=100, ge=1, le=1000, description="Maximum records to return")
@@ -51,107 +120,79 @@ class UserQueryParams(BaseModel):
 
 class UserBase(BaseModel):
     id: UUID = Field(default_factory=uuid4)
-    email: EmailStr
-    # Include pattern in schema to guide test data generation
-    # Note: StringConstraints doesn't work well with SecretStr in Pydantic v2
-    # Use Field with json_schema_extra instead
-    password: SecretStr = Field(
-        ...,
-        min_length=8,
-        max_length=128,
-        json_schema_extra={
-            "pattern": PASSWORD_PATTERN,
-            "format": None
-        }
-    )
-    role: UserRole = Field(default=UserRole.USER)
+    email: EmailField
+    password: PasswordField
+    role: UserRole = "USER"
     is_active: bool = Field(default=True)
-    first_name: Optional[str] = Field(None, max_length=100, pattern=r'^[A-Za-z \'\-]+$')
-    last_name: Optional[str] = Field(None, max_length=100, pattern=r'^[A-Za-z \'\-]+$')
-
-    @field_validator('password')
-    @classmethod
-    def validate_password(cls, v: SecretStr) -> SecretStr:
-        return validate_password_complexity(v)
+    first_name: Optional[str] = Field(None, max_length=100, pattern=NAME_PATTERN)
+    last_name: Optional[str] = Field(None, max_length=100, pattern=NAME_PATTERN)
 
     model_config = {
-        "json_schema_extra": {
-            "examples": [{
-                "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef",
-                "email": "email@example.com",
-                "role": "USER",
-                "is_active": True,
-                "password": "SecurePassword123@!",
-                "first_name": "John",
-                "last_name": "Doe",
-            }]
-        }
+        "json_schema_extra": _password_schema_extra(examples=[{
+            "id": "a1b2c3d4-e5f6-7890-1234-567890abcdef",
+            "email": "email@example.com",
+            "role": "USER",
+            "is_active": True,
+            "password": "SecurePassword123@!",
+            "first_name": "John",
+            "last_name": "Doe",
+        }])
     }
 
 class UserCreate(BaseModel):
-    email: EmailStr
-    # Schema includes pattern for better test data generation
-    # Note: StringConstraints doesn't work well with SecretStr in Pydantic v2
-    password: SecretStr = Field(
-        ...,
-        min_length=8,
-        max_length=128,
-        json_schema_extra={
-            "pattern": PASSWORD_PATTERN,
-            "format": None  # Remove format:password to match our actual validation
-        }
-    )
-    first_name: Optional[str] = Field(None, max_length=100, pattern=r'^[A-Za-z \'\-]+$')
-    last_name: Optional[str] = Field(None, max_length=100, pattern=r'^[A-Za-z \'\-]+$')
+    email: EmailField
+    password: PasswordField
+    first_name: Optional[str] = Field(None, max_length=100, pattern=NAME_PATTERN)
+    last_name: Optional[str] = Field(None, max_length=100, pattern=NAME_PATTERN)
 
-    @field_validator('password')
-    @classmethod
-    def validate_password(cls, v: SecretStr) -> SecretStr:
-        return validate_password_complexity(v)
-
-    model_config = ConfigDict(extra='forbid')  # Reject additional properties
+    model_config = ConfigDict(
+        extra='forbid',  # Reject additional properties
+        # A known-valid payload lets Schemathesis start from real data instead of
+        # searching for strings that satisfy PASSWORD_PATTERN
+        json_schema_extra=_password_schema_extra(examples=[{
+            "email": "email@example.com",
+            "password": "SecurePassword123@!",
+            "first_name": "John",
+            "last_name": "Doe",
+        }]),
+    )
 
 
 class UserRead(BaseModel):
     """User model for API responses - excludes password field from serialization."""
     id: UUID
-    email: EmailStr
+    email: EmailField
     role: UserRole
     is_active: bool
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    
-    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj: "UserBase") -> "UserRead":
+        """Build from an already-validated user without re-running validation."""
+        return cls.model_construct(
+            id=obj.id,
+            email=obj.email,
+            role=obj.role,
+            is_active=obj.is_active,
+            first_name=obj.first_name,
+            last_name=obj.last_name,
+        )
 
 class UserUpdate(BaseModel):
-    email: Optional[EmailStr] = None
-    password: Optional[SecretStr] = Field(
-        None,
-        min_length=8,
-        max_length=128,
-        json_schema_extra={
-            "pattern": PASSWORD_PATTERN,
-            "format": None
-        }
-    )
+    email: Optional[EmailField] = None
+    password: OptionalPasswordField = None
     role: Optional[UserRole] = None
     is_active: Optional[bool] = None
-    first_name: Optional[str] = Field(None, max_length=100, pattern=r'^[A-Za-z \'\-]+$')
-    last_name: Optional[str] = Field(None, max_length=100, pattern=r'^[A-Za-z \'\-]+$')
-
-    @field_validator('password')
-    @classmethod
-    def validate_password(cls, v: Optional[SecretStr]) -> Optional[SecretStr]:
-        return validate_password_complexity(v)
+    first_name: Optional[str] = Field(None, max_length=100, pattern=NAME_PATTERN)
+    last_name: Optional[str] = Field(None, max_length=100, pattern=NAME_PATTERN)
 
     model_config = ConfigDict(
         extra='forbid',  # Reject additional properties to avoid conflicts
-        json_schema_extra={
-            "examples": [{
-                "email": "updated@example.com",
-                "is_active": False,
-            }]
-        }
+        json_schema_extra=_password_schema_extra(examples=[{
+            "email": "updated@example.com",
+            "is_active": False,
+        }])
     )
 
 
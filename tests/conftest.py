@@ -0,0 +1,64 @@
+"""
+Shared pytest configuration and fixtures for Schemathesis tests.
+
+This conftest.py provides:
+- Schema fixture that loads the OpenAPI schema straight from the FastAPI app.
+  Schemathesis then drives the app in-process over ASGI - no running server,
+  sockets or HTTP round trips.
+- A storage backend fixture that runs every test twice, each time against an
+  empty store: once on the in-memory dicts and once with main.redis_client
+  pointed at fakeredis.
+- A TestClient fixture for the deterministic scenario tests.
+- A "ci" Hypothesis profile (HYPOTHESIS_PROFILE=ci) that trades example count
+  for wall-clock time: 50 examples per operation, no deadline and no too_slow
+  health check. Local runs keep Hypothesis' defaults.
+"""
+import os
+
+import fakeredis
+import pytest
+import schemathesis
+from fastapi.testclient import TestClient
+from hypothesis import HealthCheck, settings
+
+import main
+from main import app
+
+settings.register_profile(
+    "ci",
+    max_examples=50,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "default"))
+
+
+@pytest.fixture(scope="session")
+def api_schema():
+    """
+    Load the OpenAPI schema from the ASGI app.
+    This fixture is session-scoped, so the schema is loaded once per test session.
+    """
+    return schemathesis.openapi.from_asgi("/openapi.json", app)
+
+
+@pytest.fixture(autouse=True, params=["memory", "redis"])
+def storage_backend(request, monkeypatch):
+    """
+    Select the storage backend for a test.
+    Both variants start empty: the in-memory stores are swapped for fresh
+    dicts and the Redis variant gets a fresh fakeredis server.
+    """
+    for name in ("fake_db", "fake_blog_db", "email_index", "slug_index", "user_read_cache", "post_read_cache"):
+        monkeypatch.setattr(main, name, {})
+    if request.param == "redis":
+        client = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer(), decode_responses=True)
+        monkeypatch.setattr(main, "redis_client", client)
+    return request.param
+
+
+@pytest.fixture
+def client():
+    """In-process client for tests that drive the API step by step."""
+    with TestClient(app) as test_client:
+        yield test_client
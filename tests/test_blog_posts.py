@@ -14,11 +14,27 @@ Follows FASTAPI_ASSISTANT_PROMPT.md principles:
 - ASCII-only patterns
 - No business logic validation beyond schema
 """
+import asyncio
+
+import pytest
 import schemathesis
+from fastapi import HTTPException
+
+import main
+
+POST = {
+    "title": "Hello World",
+    "slug": "hello-world",
+    "content": "The full content of the first post.",
+    "author_id": "a1b2c3d4-e5f6-7890-1234-567890abcdef",
+}
 
 
-# Load the OpenAPI schema from the running local server
-schema = schemathesis.openapi.from_url("http://localhost:8000/openapi.json")
+# The OpenAPI schema comes from the session-scoped `api_schema` fixture
+# (see conftest.py), so nothing is fetched at import/collection time
+# Only /posts operations are materialized - filtering here means Schemathesis
+# never builds strategies for the other endpoints
+schema = schemathesis.pytest.from_fixture("api_schema").include(path_regex="^/posts")
 
 
 @schema.parametrize()
@@ -36,10 +52,73 @@ def test_blog_post_endpoints(case):
     Schemathesis will generate multiple test cases for each endpoint,
     testing various input combinations, edge cases, and error conditions.
     """
-    # Only test blog post endpoints
-    if not case.operation.path.startswith("/posts"):
-        return
-    
     # Call the API and validate
     # No special handling needed - schema and validation are aligned!
     case.call_and_validate()
+
+
+def test_update_after_delete_does_not_restore_post(client):
+    """A PATCH that loaded the post before a concurrent DELETE must not bring it back."""
+    post_id = client.post("/posts/", json=POST).json()["id"]
+
+    async def race():
+        stale = await main.load_post(post_id)
+        await main.remove_post(post_id, stale)
+        with pytest.raises(HTTPException) as exc_info:
+            await main.replace_post(post_id, stale, stale.slug)
+        assert exc_info.value.status_code == 404
+
+    asyncio.run(race())
+    assert client.get(f"/posts/{post_id}").status_code == 404
+    assert client.get("/posts/").json() == []
+
+
+def test_slug_index_follows_updates_and_deletes(client):
+    """Idempotent POST /posts/ keeps resolving slugs correctly across PATCH and DELETE."""
+    first = client.post("/posts/", json=POST)
+    assert first.status_code == 201
+    post_id = first.json()["id"]
+
+    # Same slug again returns the stored post
+    assert client.post("/posts/", json=POST).json()["id"] == post_id
+
+    # After a slug change the old slug is free and the new one resolves
+    moved = client.patch(f"/posts/{post_id}", json={"slug": "second-post"})
+    assert moved.status_code == 200
+    assert moved.json()["slug"] == "second-post"
+    other_id = client.post("/posts/", json=POST).json()["id"]
+    assert other_id != post_id
+    assert client.post("/posts/", json={**POST, "slug": "second-post"}).json()["id"] == post_id
+
+    # Once the slug belongs to another post, deleting the previous owner must
+    # not drop that post's index entry
+    client.patch(f"/posts/{other_id}", json={"slug": "second-post"})
+    assert client.delete(f"/posts/{post_id}").status_code == 204
+    assert client.get(f"/posts/{post_id}").status_code == 404
+    assert client.post("/posts/", json={**POST, "slug": "second-post"}).json()["id"] == other_id
+
+    # Same for a PATCH that moves the previous owner to another slug
+    third_id = client.post("/posts/", json={**POST, "slug": "third-post"}).json()["id"]
+    client.patch(f"/posts/{other_id}", json={"slug": "third-post"})
+    client.patch(f"/posts/{third_id}", json={"slug": "fourth-post"})
+    assert client.post("/posts/", json={**POST, "slug": "third-post"}).json()["id"] == other_id
+
+    # A deleted post's slug can be used again
+    assert client.delete(f"/posts/{other_id}").status_code == 204
+    reused_id = client.post("/posts/", json={**POST, "slug": "third-post"}).json()["id"]
+    assert reused_id not in (post_id, other_id, third_id)
+
+
+def test_post_list_reflects_updates_and_deletes(client):
+    """GET /posts/ serves current data in insertion order and honours skip/limit."""
+    ids = [client.post("/posts/", json={**POST, "slug": f"post-{i}"}).json()["id"] for i in range(3)]
+    assert [p["id"] for p in client.get("/posts/").json()] == ids
+
+    client.patch(f"/posts/{ids[1]}", json={"slug": "renamed-post", "title": "Renamed"})
+    middle = client.get("/posts/", params={"skip": 1, "limit": 1}).json()
+    assert [(p["id"], p["slug"], p["title"]) for p in middle] == [(ids[1], "renamed-post", "Renamed")]
+
+    client.delete(f"/posts/{ids[0]}")
+    assert [p["id"] for p in client.get("/posts/").json()] == ids[1:]
+    assert [p["id"] for p in client.get("/posts/", params={"skip": 1}).json()] == ids[2:]
+    assert client.get("/posts/", params={"skip": 2}).json() == []